@@ -2,9 +2,10 @@
 """Terminal ASCII Video Player - Main Entry Point."""
 
 import argparse
+import itertools
 import sys
 
-from video_to_ascii import VideoFrameExtractor, AsciiConverter, TerminalPlayer
+from video_to_ascii import VideoFrameExtractor, AsciiConverter, TerminalPlayer, FramePipeline
 
 
 def parse_args():
@@ -43,6 +44,12 @@ def parse_args():
         default=1.0,
         help='Contrast multiplier (default: 1.0)'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Number of frame conversion threads (default: CPU count)'
+    )
     parser.add_argument(
         '--loop', '-l',
         action='store_true',
@@ -79,50 +86,46 @@ def main():
     term_width, term_height = player.get_terminal_size()
     print(f"Terminal size: {term_width}x{term_height}")
 
-    # Extract frames
-    print("Extracting frames...")
-    frames = extractor.extract_all_frames()
-    extractor.release()
-
-    if not frames:
-        print("Error: No frames extracted from video", file=sys.stderr)
-        sys.exit(1)
-
-    print(f"Extracted {len(frames)} frames")
-
-    # Initialize converter
-    converter = AsciiConverter(charset=args.charset, contrast=args.contrast)
-
     # Calculate frame size
     if args.width:
-        target_width = args.width
+        target_width, target_height = AsciiConverter.frame_size(
+            extractor.width, extractor.height, args.width)
     else:
         target_width, target_height = player.calculate_frame_size(extractor.width, extractor.height)
-        print(f"ASCII frame size: {target_width}x{target_height}")
-
-    print(f"Converting to ASCII with width {target_width} characters...")
-
-    # Convert frames to ASCII
-    ascii_frames = []
-    for i, frame in enumerate(frames):
-        ascii_frame = converter.convert_frame(frame, target_width)
-        ascii_frames.append(ascii_frame)
+    print(f"ASCII frame size: {target_width}x{target_height}")
 
-        # Show progress
-        if (i + 1) % 100 == 0 or i + 1 == len(frames):
-            print(f"  Converted {i + 1}/{len(frames)} frames")
-
-    # Reinitialize player (to get latest terminal size)
-    player = TerminalPlayer(fps=args.fps)
+    # Initialize converter
+    converter = AsciiConverter(charset=args.charset, contrast=args.contrast,
+                               target_size=(target_width, target_height))
+
+    # Decode and convert in background threads while playing
+    # Frames beyond the playback rate are skipped while decoding
+    stride = extractor.frame_stride(args.fps)
+    pipeline = FramePipeline(extractor, converter, (target_width, target_height),
+                             workers=args.workers, target_fps=args.fps)
+
+    # Wait for the first frame so an empty video is reported before playback
+    frames = iter(pipeline)
+    first_frame = next(frames, None)
+    if first_frame is None:
+        pipeline.close()
+        extractor.release()
+        print("Error: No frames extracted from video", file=sys.stderr)
+        sys.exit(1)
+    frames = itertools.chain([first_frame], frames)
 
     print(f"\nPlaying at {args.fps} FPS...")
     print("Press Ctrl+C to stop")
 
     # Play frames
-    if args.progress:
-        player.play_with_progress(ascii_frames)
-    else:
-        player.play(ascii_frames, loop=args.loop)
+    try:
+        if args.progress:
+            player.play_with_progress(frames, total=-(-extractor.frame_count // stride))
+        else:
+            player.play(frames, loop=args.loop)
+    finally:
+        pipeline.close()
+        extractor.release()
 
     print("\nPlayback finished")
 
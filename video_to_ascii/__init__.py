@@ -3,5 +3,6 @@
 from .core import VideoFrameExtractor
 from .converter import AsciiConverter
 from .player import TerminalPlayer
+from .pipeline import FramePipeline
 
-__all__ = ['VideoFrameExtractor', 'AsciiConverter', 'TerminalPlayer']
+__all__ = ['VideoFrameExtractor', 'AsciiConverter', 'TerminalPlayer', 'FramePipeline']
@@ -0,0 +1,33 @@
+"""Numba-compiled conversion kernels.
+
+Numba is optional; when it is not installed the kernels are None and
+callers fall back to the NumPy implementation.
+
+Kernels are called concurrently from FramePipeline worker threads, so
+they are serial and compiled with nogil=True rather than parallel=True:
+Numba's threading layers are not safe to enter from several Python
+threads at once.
+"""
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    @njit(nogil=True, cache=True)
+    def table_lookup(pixels, table, out):
+        """Map gray values to charset bytes through a 256-entry table.
+
+        Args:
+            pixels: Gray values with shape (count, height, width), uint8.
+            table: Gray value -> ASCII byte table with contrast applied, uint8.
+            out: Output buffer with the same leading shape as pixels, uint8.
+        """
+        for t in range(pixels.shape[0]):
+            for y in range(pixels.shape[1]):
+                for x in range(pixels.shape[2]):
+                    out[t, y, x] = table[pixels[t, y, x]]
+else:
+    table_lookup = None
@@ -1,8 +1,13 @@
 """ASCII conversion module."""
 
+import threading
+
+import cv2
 import numpy as np
 from PIL import Image
-from typing import List
+from typing import List, Optional, Tuple, Union
+
+from . import _kernels
 
 
 class AsciiConverter:
@@ -10,71 +15,258 @@ class AsciiConverter:
 
     DEFAULT_CHARSET = " .:-=+*#%@"
 
-    def __init__(self, charset: str = None, contrast: float = 1.0):
+    def __init__(self, charset: str = None, contrast: float = 1.0,
+                 interpolation: int = cv2.INTER_AREA,
+                 target_size: Optional[Tuple[int, int]] = None):
         """Initialize the ASCII converter.
 
         Args:
             charset: Characters from dark to light. Default: " .:-=+*#%@"
             contrast: Contrast multiplier. Default: 1.0
+            interpolation: OpenCV interpolation flag used for resizing.
+                Default: cv2.INTER_AREA (pass cv2.INTER_LANCZOS4 for stills)
+            target_size: Output (width, height) in characters, computed once
+                for a video. Default: derived from the width per call
         """
-        self.charset = charset or self.DEFAULT_CHARSET
-        self.contrast = contrast
+        self._charset = charset or self.DEFAULT_CHARSET
+        self._contrast = contrast
+        self.interpolation = interpolation
+        self.target_size = target_size
+
+        # Cached ((src_width, src_height, width), size) for the last call,
+        # replaced as one tuple so concurrent callers never see a torn pair
+        self._size_cache: Optional[Tuple[Tuple[int, int, int], Tuple[int, int]]] = None
+
+        # Per-thread reusable output buffers (pipeline workers run concurrently)
+        self._local = threading.local()
+
+        self._build_table()
+
+    @property
+    def charset(self) -> str:
+        """Characters from dark to light."""
+        return self._charset
+
+    @charset.setter
+    def charset(self, value: str):
+        self._charset = value or self.DEFAULT_CHARSET
+        self._build_table()
+
+    @property
+    def contrast(self) -> float:
+        """Contrast multiplier."""
+        return self._contrast
+
+    @contrast.setter
+    def contrast(self, value: float):
+        self._contrast = value
+        self._build_table()
 
-    def convert_frame(self, frame: np.ndarray, width: int) -> str:
+    def _build_table(self):
+        """Precompute the gray value -> ASCII byte table.
+
+        Contrast and quantization are baked into a single 256-entry table,
+        so converting a frame is one lookup per pixel. Charsets with
+        non-ASCII characters (e.g. " ░▒▓█") get a table of characters
+        instead, and _full_table is None.
+        """
+        self._n = len(self._charset)
+
+        # Apply contrast adjustment to every possible gray value
+        v = np.arange(256, dtype=np.float64)
+        v = np.clip((v - 128) * self._contrast + 128, 0, 255).astype(np.int32)
+
+        # Index computation: gray * len(charset) / 256
+        idx = np.minimum((v * self._n) >> 8, self._n - 1)
+
+        # Character table for the non-ASCII path
+        self._char_table = np.array(list(self._charset))[idx]
+
+        try:
+            # Lookup table: character index -> ASCII byte
+            self._lut = np.frombuffer(self._charset.encode('ascii'), dtype=np.uint8)
+        except UnicodeEncodeError:
+            self._lut = None
+            self._full_table = None
+        else:
+            self._full_table = self._lut[idx]
+
+    def convert_frame(self, frame: np.ndarray, width: Optional[int] = None,
+                      as_bytes: bool = False) -> Union[str, bytes]:
         """Convert a video frame to ASCII art.
 
+        Frames already extracted as grayscale at the target size skip the
+        color conversion and resize steps.
+
         Args:
-            frame: Video frame in BGR format (numpy array).
-            width: Target width in characters.
+            frame: Video frame in BGR or grayscale format (numpy array).
+            width: Target width in characters. Default: target_size width
+            as_bytes: Return ASCII-encoded bytes instead of str. Default: False
 
         Returns:
             ASCII art string representation of the frame.
         """
-        # Convert BGR to RGB
-        rgb_frame = frame[:, :, ::-1]
+        # Convert BGR to grayscale first so resizing only touches one channel
+        if frame.ndim == 3:
+            pixels = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        else:
+            pixels = frame
 
-        # Create PIL Image
-        img = Image.fromarray(rgb_frame)
+        if self.target_size is not None and width in (None, self.target_size[0]):
+            size = self.target_size
+        elif width is None:
+            raise ValueError("width is required when no target_size is set")
+        else:
+            size = self._target_size(pixels.shape[1], pixels.shape[0], width)
 
-        # Calculate height to maintain aspect ratio
-        # Characters are typically ~2x taller than wide
-        aspect_ratio = img.height / img.width
-        height = int(width * aspect_ratio * 0.5)
+        # Map pixels to ASCII characters
+        return self.convert_batch(pixels[np.newaxis], as_bytes=as_bytes, size=size)[0]
+
+    def convert_batch(self, frames: np.ndarray, as_bytes: bool = False,
+                      size: Optional[Tuple[int, int]] = None) -> Union[List[str], List[bytes]]:
+        """Convert a stack of grayscale frames to ASCII art in one pass.
 
-        # Resize image
-        img = img.resize((width, height), Image.Resampling.LANCZOS)
+        Args:
+            frames: Gray values with shape (count, height, width).
+            as_bytes: Return encoded bytes (ASCII, or UTF-8 for non-ASCII
+                charsets) instead of str, so frames can be written to the
+                terminal without re-encoding. Default: False
+            size: Output (width, height) in characters. Frames of another
+                size are resized first. Default: the frames' own size
 
-        # Convert to grayscale
-        gray_img = img.convert('L')
+        Returns:
+            List of ASCII art strings (or bytes), one per frame.
+        """
+        count, src_height, src_width = frames.shape
+        width, height = size if size is not None else (src_width, src_height)
 
-        # Convert to numpy array
-        pixels = np.array(gray_img)
+        if (width, height) != (src_width, src_height):
+            # Area averaging is cheap and accurate for heavy downscaling
+            frames = np.stack([
+                cv2.resize(frame, (width, height), interpolation=self.interpolation)
+                for frame in frames
+            ])
 
-        # Apply contrast adjustment
-        if self.contrast != 1.0:
-            pixels = ((pixels - 128) * self.contrast + 128)
-            pixels = np.clip(pixels, 0, 255)
+        if self._full_table is None:
+            return self._convert_unicode(frames, as_bytes)
 
-        # Map pixels to ASCII characters
-        ascii_lines = []
-        for row in pixels:
-            line = ''.join(self._pixel_to_char(pixel) for pixel in row)
-            ascii_lines.append(line)
+        out = self._out_buffer(count, height, width)
+        if _kernels.table_lookup is not None:
+            # Lookup without the GIL, written straight into the output buffer
+            _kernels.table_lookup(frames, self._full_table, out[:, :, :width])
+        else:
+            # Gather straight into the buffer; clip skips the bounds check
+            np.take(self._full_table, frames, out=out[:, :, :width], mode='clip')
+
+        return self._frames_from_buffer(out, as_bytes)
+
+    def _convert_unicode(self, frames: np.ndarray,
+                         as_bytes: bool) -> Union[List[str], List[bytes]]:
+        """Convert frames using a charset with non-ASCII characters.
+
+        Args:
+            frames: Gray values with shape (count, height, width).
+            as_bytes: Return UTF-8 encoded bytes instead of str.
+
+        Returns:
+            List of ASCII art strings (or bytes), one per frame.
+        """
+        count, height, width = frames.shape
+        chars = np.ascontiguousarray(self._char_table[frames])
+
+        # View each row of single characters as one string
+        rows = chars.view(f'U{width}').reshape(count, height)
+        frames_str = ['\n'.join(frame_rows) for frame_rows in rows.tolist()]
+        if as_bytes:
+            return [frame.encode('utf-8') for frame in frames_str]
+        return frames_str
 
-        return '\n'.join(ascii_lines)
+    @staticmethod
+    def _frames_from_buffer(out: np.ndarray, as_bytes: bool) -> Union[List[str], List[bytes]]:
+        """Copy each frame out of an output buffer.
+
+        Args:
+            out: Output buffer with shape (count, height, width + 1).
+            as_bytes: Return ASCII-encoded bytes instead of str.
+
+        Returns:
+            List of ASCII art strings (or bytes), one per frame.
+        """
+        # Drop each frame's trailing newline while copying it out
+        frames_bytes = [slab[:-1].tobytes() for slab in out.reshape(len(out), -1)]
+        if as_bytes:
+            return frames_bytes
+        return [frame.decode('ascii') for frame in frames_bytes]
+
+    def _out_buffer(self, count: int, height: int, width: int) -> np.ndarray:
+        """Get a reusable output buffer for a batch of frames.
+
+        The buffer has a newline column after every row, written once when
+        it is allocated; it is reused while the frame size stays the same.
+
+        Args:
+            count: Number of frames.
+            height: Frame height in characters.
+            width: Frame width in characters.
+
+        Returns:
+            Array with shape (count, height, width + 1), uint8.
+        """
+        out = getattr(self._local, 'out', None)
+        if out is None or out.shape[1:] != (height, width + 1) or out.shape[0] < count:
+            out = np.empty((count, height, width + 1), dtype=np.uint8)
+            out[:, :, width] = ord('\n')
+            self._local.out = out
+        return out[:count]
+
+    def _target_size(self, src_width: int, src_height: int, width: int) -> Tuple[int, int]:
+        """Get the output size for a source image, caching the last result.
+
+        Args:
+            src_width: Source width in pixels.
+            src_height: Source height in pixels.
+            width: Target width in characters.
+
+        Returns:
+            Tuple of (width, height) in characters.
+        """
+        key = (src_width, src_height, width)
+        cache = self._size_cache
+        if cache is None or cache[0] != key:
+            cache = (key, self.frame_size(src_width, src_height, width))
+            self._size_cache = cache
+        return cache[1]
+
+    @staticmethod
+    def frame_size(src_width: int, src_height: int, width: int) -> Tuple[int, int]:
+        """Get the output size that keeps a source's aspect ratio.
+
+        Args:
+            src_width: Source width in pixels.
+            src_height: Source height in pixels.
+            width: Target width in characters.
+
+        Returns:
+            Tuple of (width, height) in characters.
+        """
+        # Characters are typically ~2x taller than wide
+        aspect_ratio = src_height / src_width
+        return width, int(width * aspect_ratio * 0.5)
 
     def _pixel_to_char(self, gray_value: int) -> str:
         """Map a gray value (0-255) to an ASCII character.
 
+        Single-pixel counterpart of convert_batch(), using the same
+        integer index computation.
+
         Args:
             gray_value: Gray value from 0 to 255.
 
         Returns:
             Corresponding ASCII character.
         """
-        char_index = int(gray_value / 256 * len(self.charset))
-        char_index = min(char_index, len(self.charset) - 1)
-        return self.charset[char_index]
+        char_index = (int(gray_value) * self._n) >> 8
+        return self.charset[min(char_index, self._n - 1)]
 
     def convert_image(self, image_path: str, width: int) -> str:
         """Convert an image file to ASCII art.
@@ -87,28 +279,8 @@ class AsciiConverter:
             ASCII art string representation.
         """
         img = Image.open(image_path)
-        img = img.convert('RGB')
-
-        # Calculate height
-        aspect_ratio = img.height / img.width
-        height = int(width * aspect_ratio * 0.5)
-
-        # Resize
-        img = img.resize((width, height), Image.Resampling.LANCZOS)
-
-        # Convert to grayscale
-        gray_img = img.convert('L')
-        pixels = np.array(gray_img)
-
-        # Apply contrast
-        if self.contrast != 1.0:
-            pixels = ((pixels - 128) * self.contrast + 128)
-            pixels = np.clip(pixels, 0, 255)
-
-        # Map to ASCII
-        ascii_lines = []
-        for row in pixels:
-            line = ''.join(self._pixel_to_char(pixel) for pixel in row)
-            ascii_lines.append(line)
+        gray = np.asarray(img.convert('L'))
 
-        return '\n'.join(ascii_lines)
+        # Resize and map to ASCII
+        size = self._target_size(gray.shape[1], gray.shape[0], width)
+        return self.convert_batch(gray[np.newaxis], size=size)[0]
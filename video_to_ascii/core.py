@@ -2,24 +2,40 @@
 
 import cv2
 import numpy as np
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple, Union
+
+try:
+    import av
+except ImportError:
+    av = None
+
+# Display rotation (as reported by OpenCV) -> cv2.rotate() code
+_ROTATE_CODES = {
+    90: cv2.ROTATE_90_CLOCKWISE,
+    180: cv2.ROTATE_180,
+    270: cv2.ROTATE_90_COUNTERCLOCKWISE,
+}
 
 
 class VideoFrameExtractor:
     """Extracts frames from video files."""
 
-    def __init__(self, video_path: str):
+    def __init__(self, video_path: str, use_av: bool = True):
         """Initialize with video file path.
 
         Args:
             video_path: Path to the MP4 video file.
+            use_av: Decode with PyAV (ffmpeg) in iter_frames() when it is
+                installed. Default: True
         """
         self.video_path = video_path
+        self.use_av = use_av
         self.cap: Optional[cv2.VideoCapture] = None
         self.fps: float = 0.0
         self.frame_count: int = 0
         self.width: int = 0
         self.height: int = 0
+        self.rotation: int = 0
 
     def open(self) -> bool:
         """Open the video file.
@@ -35,6 +51,10 @@ class VideoFrameExtractor:
         self.frame_count = int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT))
         self.width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
         self.height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        # OpenCV applies the stream's display rotation; width/height above
+        # are already the rotated dimensions
+        if self.cap.get(cv2.CAP_PROP_ORIENTATION_AUTO):
+            self.rotation = int(self.cap.get(cv2.CAP_PROP_ORIENTATION_META)) % 360
         return True
 
     def extract_frame(self) -> Optional[np.ndarray]:
@@ -52,19 +72,146 @@ class VideoFrameExtractor:
 
         return frame
 
-    def extract_all_frames(self) -> List[np.ndarray]:
+    def frame_stride(self, target_fps: Optional[float] = None) -> int:
+        """Get how many source frames to advance per output frame.
+
+        Args:
+            target_fps: Playback frames per second. None keeps every frame.
+
+        Returns:
+            Frame stride, at least 1.
+        """
+        if not target_fps or self.fps <= 0:
+            return 1
+        return max(1, round(self.fps / target_fps))
+
+    def extract_all_frames(self, target_size: Optional[Tuple[int, int]] = None,
+                           grayscale: bool = True,
+                           target_fps: Optional[float] = None) -> Union[List[np.ndarray], np.ndarray]:
         """Extract all frames from the video.
 
+        Frames are converted and downscaled as they are decoded, so only
+        small buffers are kept in memory. With a target size, frames are
+        written into one contiguous array preallocated from frame_count,
+        ready for AsciiConverter.convert_batch().
+
+        Args:
+            target_size: Output (width, height) in pixels. None keeps the
+                original resolution.
+            grayscale: Convert frames from BGR to grayscale. Default: True
+            target_fps: Playback frames per second; frames beyond this rate
+                are skipped. Default: keep every frame
+
         Returns:
-            List of frames as numpy arrays.
+            Array of shape (count, height, width[, 3]) if target_size is
+            given, otherwise a list of frames as numpy arrays.
+        """
+        if target_size is None:
+            return list(self.iter_frames(grayscale=grayscale, target_fps=target_fps))
+
+        width, height = target_size
+        shape = (height, width) if grayscale else (height, width, 3)
+        stride = self.frame_stride(target_fps)
+        expected = -(-self.frame_count // stride)
+        out = np.empty((max(expected, 1),) + shape, dtype=np.uint8)
+
+        count = 0
+        for frame in self.iter_frames(target_size=target_size, grayscale=grayscale,
+                                      target_fps=target_fps):
+            if count == len(out):
+                # The container's frame count was an underestimate
+                out = np.concatenate([out, np.empty_like(out)])
+            out[count] = frame
+            count += 1
+        return out[:count]
+
+    def iter_frames(self, target_size: Optional[Tuple[int, int]] = None,
+                    grayscale: bool = True,
+                    target_fps: Optional[float] = None) -> Iterator[np.ndarray]:
+        """Iterate over the remaining frames of the video.
+
+        When reading from the start and PyAV is available, frames are
+        decoded by ffmpeg, which also does the scaling and pixel format
+        conversion; otherwise OpenCV is used. Either way the capture ends
+        up past the frames read, so a second call continues from there
+        until reset() is called.
+
+        Args:
+            target_size: Output (width, height) in pixels. None keeps the
+                original resolution.
+            grayscale: Convert frames from BGR to grayscale. Default: True
+            target_fps: Playback frames per second; when the video's FPS is
+                higher, only every frame_stride(target_fps)-th frame is
+                yielded. Default: keep every frame
+
+        Yields:
+            Frames as numpy arrays.
         """
-        frames = []
+        if self.cap is None or not self.cap.isOpened():
+            return
+
+        stride = self.frame_stride(target_fps)
+
+        if self.use_av and av is not None and self.cap.get(cv2.CAP_PROP_POS_FRAMES) == 0:
+            yield from self._iter_av_frames(target_size, grayscale, stride)
+            return
+
         while True:
             frame = self.extract_frame()
             if frame is None:
                 break
-            frames.append(frame)
-        return frames
+            if grayscale:
+                frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            if target_size is not None:
+                frame = cv2.resize(frame, target_size, interpolation=cv2.INTER_AREA)
+            yield frame
+
+            # grab() skips frames without converting them to BGR
+            for _ in range(stride - 1):
+                if self.cap is None or not self.cap.grab():
+                    return
+
+    def _iter_av_frames(self, target_size: Optional[Tuple[int, int]],
+                        grayscale: bool, stride: int = 1) -> Iterator[np.ndarray]:
+        """Decode frames with PyAV, scaling and converting them in ffmpeg.
+
+        Args:
+            target_size: Output (width, height) in pixels, or None.
+            grayscale: Output single-channel gray instead of BGR.
+            stride: Yield every stride-th frame. Default: 1
+
+        Yields:
+            Frames as numpy arrays.
+        """
+        width, height = target_size if target_size is not None else (None, None)
+        pix_fmt = 'gray' if grayscale else 'bgr24'
+        rotate = _ROTATE_CODES.get(self.rotation)
+        if self.rotation in (90, 270):
+            # Scale the coded frame to the pre-rotation box
+            width, height = height, width
+
+        container = av.open(self.video_path)
+        decoded = 0
+        try:
+            stream = container.streams.video[0]
+            stream.thread_type = 'AUTO'
+            for frame in container.decode(stream):
+                decoded += 1
+                # Skipped frames are decoded but never scaled or converted
+                if (decoded - 1) % stride:
+                    continue
+                # swscale does resize + format conversion in one pass
+                frame = frame.reformat(width=width, height=height, format=pix_fmt,
+                                       interpolation='AREA')
+                frame = frame.to_ndarray()
+                if rotate is not None:
+                    frame = cv2.rotate(frame, rotate)
+                yield frame
+        finally:
+            container.close()
+            # Keep the capture in step so iter_frames() resumes after these
+            if self.cap is not None and decoded:
+                self.cap.set(cv2.CAP_PROP_POS_FRAMES, decoded)
 
     def reset(self):
         """Reset video to the beginning."""
@@ -0,0 +1,164 @@
+"""Streaming decode -> convert pipeline module."""
+
+import heapq
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .converter import AsciiConverter
+from .core import VideoFrameExtractor
+
+# Marks the end of a queue's stream
+_DONE = object()
+
+
+class _Failure:
+    """Carries an exception from a pipeline thread to the consumer."""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+class FramePipeline:
+    """Decodes and converts frames concurrently, yielding them in order."""
+
+    def __init__(self, extractor: VideoFrameExtractor, converter: AsciiConverter,
+                 target_size: Tuple[int, int], workers: Optional[int] = None,
+                 queue_size: int = 64, batch_size: int = 16,
+                 target_fps: Optional[float] = None):
+        """Initialize the pipeline.
+
+        Args:
+            extractor: Opened video frame extractor.
+            converter: ASCII converter used by the worker threads.
+            target_size: ASCII frame (width, height) in characters.
+            workers: Number of conversion threads. Default: CPU count
+            queue_size: Maximum batches buffered between stages. Default: 64
+            batch_size: Frames converted together per batch. Default: 16
+            target_fps: Playback frames per second; excess source frames
+                are skipped at decode time. Default: keep every frame
+        """
+        self.extractor = extractor
+        self.converter = converter
+        self.target_size = target_size
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = max(1, batch_size)
+        self.target_fps = target_fps
+        self._frames: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._results: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._stop = threading.Event()
+        self._decoder: Optional[threading.Thread] = None
+
+    def _put(self, q: queue.Queue, item) -> bool:
+        """Put an item on a queue, giving up once the pipeline is stopped.
+
+        Returns:
+            True if the item was queued, False if the pipeline was stopped.
+        """
+        while not self._stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _decode(self):
+        """Decoder thread: read, grayscale and resize frames into batches."""
+        seq = 0
+        count = 0
+        try:
+            width, height = self.target_size
+            batch = np.empty((self.batch_size, height, width), dtype=np.uint8)
+            frames = self.extractor.iter_frames(target_size=self.target_size,
+                                                target_fps=self.target_fps)
+            for frame in frames:
+                batch[count] = frame
+                count += 1
+                if count == self.batch_size:
+                    if not self._put(self._frames, (seq, batch)):
+                        return
+                    # Workers own queued batches, so start a fresh one
+                    seq += 1
+                    count = 0
+                    batch = np.empty((self.batch_size, height, width), dtype=np.uint8)
+            if count:
+                self._put(self._frames, (seq, batch[:count]))
+        except Exception as e:
+            # Play the frames decoded so far, then fail in sequence order
+            if count and self._put(self._frames, (seq, batch[:count])):
+                seq += 1
+            self._put(self._results, (seq, _Failure(e)))
+        finally:
+            # One end marker per worker, even if decoding failed
+            for _ in range(self.workers):
+                if not self._put(self._frames, _DONE):
+                    break
+
+    def _convert(self):
+        """Worker thread: convert batches of grayscale frames to ASCII."""
+        try:
+            while True:
+                item = self._frames.get()
+                if item is _DONE:
+                    break
+                seq, frames = item
+                try:
+                    result = self.converter.convert_batch(frames, as_bytes=True)
+                except Exception as e:
+                    result = _Failure(e)
+                if not self._put(self._results, (seq, result)):
+                    return
+        finally:
+            self._put(self._results, _DONE)
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Run the pipeline and yield ASCII frames (as bytes) in decode order.
+
+        Raises:
+            Exception: Any error raised while decoding or converting frames.
+        """
+        self._decoder = threading.Thread(target=self._decode, daemon=True)
+        self._decoder.start()
+
+        executor = ThreadPoolExecutor(max_workers=self.workers)
+        for _ in range(self.workers):
+            executor.submit(self._convert)
+
+        # Workers finish out of order; hold early frames until their turn
+        pending: List[Tuple[int, Union[List[bytes], _Failure]]] = []
+        next_seq = 0
+        running = self.workers
+        try:
+            while running:
+                item = self._results.get()
+                if item is _DONE:
+                    running -= 1
+                    continue
+                heapq.heappush(pending, item)
+                while pending and pending[0][0] == next_seq:
+                    frames = heapq.heappop(pending)[1]
+                    if isinstance(frames, _Failure):
+                        raise frames.error
+                    yield from frames
+                    next_seq += 1
+        finally:
+            self.close()
+            executor.shutdown(wait=False)
+
+    def close(self):
+        """Stop the decoder and worker threads."""
+        self._stop.set()
+        # Unblock workers waiting for frames
+        for _ in range(self.workers):
+            try:
+                self._frames.put_nowait(_DONE)
+            except queue.Full:
+                break
+        # The decoder must be done with the capture before it is released
+        if self._decoder is not None:
+            self._decoder.join()
@@ -1,13 +1,50 @@
 """Terminal player module for ASCII video playback."""
 
+import contextlib
+import functools
 import os
 import sys
 import time
 import shutil
+import signal
 import fcntl
 import termios
 import tty
-from typing import List, Optional, Tuple
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+from .converter import AsciiConverter
+
+
+@functools.lru_cache(maxsize=None)
+def _compute_target_size(video_width: int, video_height: int,
+                         term_width: int, term_height: int) -> Tuple[int, int]:
+    """Calculate the ASCII frame size for a video in a terminal.
+
+    Args:
+        video_width: Original video width in pixels.
+        video_height: Original video height in pixels.
+        term_width: Terminal width in characters.
+        term_height: Terminal height in lines.
+
+    Returns:
+        Tuple of (width, height) in characters.
+    """
+    # Use 70% of terminal width to leave margin
+    width, height = AsciiConverter.frame_size(video_width, video_height,
+                                              int(term_width * 0.7))
+
+    # Ensure height fits in terminal (use 90% to leave room for cursor)
+    max_height = int(term_height * 0.9)
+    if height > max_height:
+        height = max_height
+        # Recalculate width based on height limit
+        width = int(height / (video_height / video_width * 0.5))
+
+    # Ensure minimum size
+    width = max(width, 20)
+    height = max(height, 10)
+
+    return width, height
 
 
 class TerminalPlayer:
@@ -25,9 +62,48 @@ class TerminalPlayer:
         self.terminal_height = 24
         self._update_terminal_size()
 
+        # Frames are written as pre-encoded bytes straight to the stdout fd
+        self._clear = b'\033[H\033[J'
+
+        # Lines currently on screen, used to redraw only what changed
+        self._prev_lines: Optional[List[bytes]] = None
+
+        # Set by the SIGWINCH handler; the next draw is a full redraw
+        self._resized = False
+
+    def _on_resize(self, signum, frame):
+        """SIGWINCH handler: refresh the size and force a full redraw."""
+        self._update_terminal_size()
+        self._resized = True
+
+    @contextlib.contextmanager
+    def _watch_resize(self):
+        """Handle SIGWINCH during playback, restoring the previous handler after.
+
+        Only installed on Unix, from the main thread.
+        """
+        # No handler was active before playback, so the size may be stale
+        self._update_terminal_size()
+
+        previous = None
+        installed = False
+        if hasattr(signal, 'SIGWINCH'):
+            try:
+                previous = signal.signal(signal.SIGWINCH, self._on_resize)
+                installed = True
+            except ValueError:
+                # Signal handlers can only be installed from the main thread
+                pass
+        try:
+            yield
+        finally:
+            if installed:
+                signal.signal(signal.SIGWINCH,
+                              previous if previous is not None else signal.SIG_DFL)
+
     def _update_terminal_size(self):
         """Update terminal size by querying the actual terminal."""
-        # First try shutil
+        # shutil reads TIOCGWINSZ via os.get_terminal_size(), no subprocess
         try:
             size = shutil.get_terminal_size(fallback=(80, 24))
             self.terminal_width = size.columns
@@ -35,37 +111,6 @@ class TerminalPlayer:
         except (AttributeError, OSError):
             pass
 
-        # Try to get more accurate size using ioctl
-        try:
-            import io
-            from os import environ
-
-            def get_size():
-                from os import popen
-                try:
-                    # Try using stty
-                    output = popen('stty size', 'r').read().split()
-                    if len(output) == 2:
-                        return int(output[0]), int(output[1])
-                except:
-                    pass
-
-                # Try using tput
-                try:
-                    output = popen('tput lines && tput cols', 'r').read().split()
-                    if len(output) == 2:
-                        return int(output[0]), int(output[1])
-                except:
-                    pass
-
-                return None
-
-            result = get_size()
-            if result:
-                self.terminal_height, self.terminal_width = result
-        except:
-            pass
-
     def _get_terminal_width(self) -> int:
         """Get terminal width in characters."""
         return self.terminal_width
@@ -93,29 +138,8 @@ class TerminalPlayer:
         Returns:
             Tuple of (width, height) in characters.
         """
-        # Update terminal size first
-        self._update_terminal_size()
-
-        # Use 70% of terminal width to leave margin
-        width = int(self.terminal_width * 0.7)
-
-        # Calculate height to maintain aspect ratio
-        # Characters are typically ~2x taller than wide
-        aspect_ratio = video_height / video_width
-        height = int(width * aspect_ratio * 0.5)
-
-        # Ensure height fits in terminal (use 90% to leave room for cursor)
-        max_height = int(self.terminal_height * 0.9)
-        if height > max_height:
-            height = max_height
-            # Recalculate width based on height limit
-            width = int(height / (aspect_ratio * 0.5))
-
-        # Ensure minimum size
-        width = max(width, 20)
-        height = max(height, 10)
-
-        return width, height
+        return _compute_target_size(video_width, video_height,
+                                    self.terminal_width, self.terminal_height)
 
     def clear_screen(self):
         """Clear the terminal screen."""
@@ -132,99 +156,211 @@ class TerminalPlayer:
         sys.stdout.write('\033[H')
         sys.stdout.flush()
 
-    def render_frame(self, frame: str, max_lines: int = None):
+    def _write(self, data: bytes):
+        """Write bytes to stdout, bypassing Python's text I/O layer.
+
+        Falls back to sys.stdout.write() when stdout has no file
+        descriptor (captured output, IDE or notebook consoles).
+
+        Args:
+            data: Bytes to write.
+        """
+        try:
+            fd = sys.stdout.fileno()
+        except (AttributeError, OSError, ValueError):
+            sys.stdout.write(data.decode('utf-8'))
+            sys.stdout.flush()
+            return
+
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+
+    @staticmethod
+    def _split_lines(frame: Union[str, bytes], max_lines: int) -> List[bytes]:
+        """Encode a frame and split it into at most max_lines lines.
+
+        Args:
+            frame: ASCII art string or bytes.
+            max_lines: Maximum number of lines to keep.
+
+        Returns:
+            Frame lines as bytes.
+        """
+        # Bytes frames are used as-is; only str frames need encoding
+        if isinstance(frame, str):
+            frame = frame.encode('utf-8')
+        return frame.split(b'\n', max_lines)[:max_lines]
+
+    def _draw(self, lines: List[bytes]):
+        """Draw screen lines, rewriting only those that changed.
+
+        The first draw after a reset clears the screen and writes every
+        line; later draws move the cursor to each changed line and
+        overwrite it, all in a single write.
+
+        Args:
+            lines: Screen lines from the top of the terminal.
+        """
+        prev = self._prev_lines
+        if self._resized:
+            # Clear the flag first so a resize during this draw is kept
+            self._resized = False
+            prev = None
+        if prev is None:
+            payload = self._clear + b'\n'.join(lines)
+        else:
+            parts = []
+            for i, line in enumerate(lines):
+                if i >= len(prev) or line != prev[i]:
+                    parts.append(b'\033[%d;1H\033[2K%s' % (i + 1, line))
+            # Blank out lines left over from a taller previous frame
+            for i in range(len(lines), len(prev)):
+                parts.append(b'\033[%d;1H\033[2K' % (i + 1))
+            if parts and lines:
+                # Park the cursor at the end of the frame; the column counts
+                # characters, not UTF-8 bytes
+                column = len(lines[-1].decode('utf-8', 'replace')) + 1
+                parts.append(b'\033[%d;%dH' % (len(lines), column))
+            payload = b''.join(parts)
+
+        self._prev_lines = lines
+        if payload:
+            self._write(payload)
+
+    def render_frame(self, frame: Union[str, bytes], max_lines: int = None):
         """Render a single ASCII frame.
 
         Args:
-            frame: ASCII art string to display.
+            frame: ASCII art string or bytes to display.
             max_lines: Maximum number of lines to display.
         """
-        # Update terminal size
-        self._update_terminal_size()
-
         # Limit lines if needed
         if max_lines is None:
             max_lines = self.terminal_height - 1
 
-        lines = frame.split('\n')
-        if len(lines) > max_lines:
-            lines = lines[:max_lines]
+        self._draw(self._split_lines(frame, max_lines))
 
-        # Move to top and clear screen
-        sys.stdout.write('\033[H\033[J')
-        sys.stdout.write('\n'.join(lines))
-        sys.stdout.flush()
+    def _paced(self, frames: Iterable) -> Iterator[Tuple[int, object]]:
+        """Pace frames on a fixed monotonic clock.
+
+        Each frame is due at start + index * frame_duration, so render time
+        does not accumulate as drift. Frames more than one frame late
+        because rendering fell behind are dropped to catch up. When a frame
+        is late because the source was slow to produce it, the clock is
+        moved to that frame instead, so a slow stream plays slowly rather
+        than freezing.
+
+        Args:
+            frames: Frames to pace.
+
+        Yields:
+            Tuples of (frame index, frame) for frames that should be shown.
+        """
+        start = None
+        # Time the next frame was requested from the source
+        requested = None
+        for i, frame in enumerate(frames):
+            now = time.monotonic()
+            if start is None:
+                start = now
+            deadline = start + i * self.frame_duration
+            if now > deadline + self.frame_duration:
+                if requested is not None and requested > deadline + self.frame_duration:
+                    # Already late before asking the source: drop to catch up
+                    requested = now
+                    continue
+                # The source was slow: restart the clock at this frame
+                start = now - i * self.frame_duration
+                deadline = now
+
+            yield i, frame
+
+            # Wait until the next frame is due
+            sleep_for = deadline + self.frame_duration - time.monotonic()
+            if sleep_for > 0:
+                time.sleep(sleep_for)
+            requested = time.monotonic()
+
+    @staticmethod
+    def _looped(frames: Iterable) -> Iterator:
+        """Yield frames, then replay them indefinitely.
+
+        Args:
+            frames: Frames for the first pass; they are kept for replay.
 
-    def play(self, frames: List[str], loop: bool = False):
+        Yields:
+            Frames from the first pass, repeated.
+        """
+        history = []
+        for frame in frames:
+            history.append(frame)
+            yield frame
+        while history:
+            yield from history
+
+    def play(self, frames: Iterable[Union[str, bytes]], loop: bool = False):
         """Play ASCII frames in sequence.
 
+        Frames may come from a list or a streaming iterator; when looping,
+        frames from the first pass are kept for replay.
+
         Args:
-            frames: List of ASCII art strings.
+            frames: ASCII art strings or pre-encoded bytes.
             loop: Whether to loop playback indefinitely.
         """
-        total_frames = len(frames)
-        if total_frames == 0:
-            print("No frames to play")
-            return
-
-        # Update terminal size and calculate max lines
-        self._update_terminal_size()
-        max_lines = self.terminal_height - 1
+        # Raw fd writes bypass sys.stdout, so drain its buffer first
+        sys.stdout.flush()
+        self._prev_lines = None
 
-        frame_index = 0
-        try:
-            while True:
-                self.render_frame(frames[frame_index], max_lines=max_lines)
+        source = self._looped(frames) if loop else frames
 
-                # Wait for next frame
-                time.sleep(self.frame_duration)
+        rendered = 0
+        with self._watch_resize():
+            try:
+                for _, frame in self._paced(source):
+                    self.render_frame(frame)
+                    rendered += 1
 
-                # Move to next frame
-                frame_index += 1
-                if frame_index >= total_frames:
-                    if loop:
-                        frame_index = 0
-                    else:
-                        break
+                if rendered == 0:
+                    print("No frames to play")
 
-        except KeyboardInterrupt:
-            print("\nPlayback stopped by user")
+            except KeyboardInterrupt:
+                print("\nPlayback stopped by user")
 
-    def play_with_progress(self, frames: List[str]):
+    def play_with_progress(self, frames: Iterable[Union[str, bytes]], total: Optional[int] = None):
         """Play ASCII frames with progress indicator.
 
         Args:
-            frames: List of ASCII art strings.
+            frames: ASCII art strings or pre-encoded bytes.
+            total: Total number of frames. Default: len(frames)
         """
-        total_frames = len(frames)
-        if total_frames == 0:
-            print("No frames to play")
-            return
+        total_frames = len(frames) if total is None else total
 
-        # Update terminal size
-        self._update_terminal_size()
-        # Reserve 2 lines for progress info
-        max_lines = self.terminal_height - 2
+        # Raw fd writes bypass sys.stdout, so drain its buffer first
+        sys.stdout.flush()
+        self._prev_lines = None
 
-        try:
-            for i, frame in enumerate(frames):
-                # Add progress info to top
-                progress = f"Frame {i + 1}/{total_frames} | Terminal: {self.terminal_width}x{self.terminal_height}"
+        rendered = 0
+        with self._watch_resize():
+            try:
+                for i, frame in self._paced(frames):
+                    rendered += 1
+
+                    # Add progress info to top
+                    progress = f"Frame {i + 1}/{total_frames} | Terminal: {self.terminal_width}x{self.terminal_height}"
 
-                # Limit frame lines
-                lines = frame.split('\n')
-                if len(lines) > max_lines:
-                    lines = lines[:max_lines]
+                    # Reserve 2 lines for progress info
+                    max_lines = self.terminal_height - 2
 
-                sys.stdout.write('\033[H\033[J')
-                sys.stdout.write(progress + '\n')
-                sys.stdout.write('\n'.join(lines))
-                sys.stdout.flush()
+                    self._draw([progress.encode('utf-8')] + self._split_lines(frame, max_lines))
 
-                time.sleep(self.frame_duration)
+                if rendered == 0:
+                    print("No frames to play")
 
-        except KeyboardInterrupt:
-            print("\nPlayback stopped by user")
+            except KeyboardInterrupt:
+                print("\nPlayback stopped by user")
 
     def set_fps(self, fps: float):
         """Set the playback frame rate.